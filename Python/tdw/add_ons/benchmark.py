@@ -1,4 +1,4 @@
-from time import time
+from time import perf_counter
 from typing import List
 from tdw.add_ons.add_on import AddOn
 
@@ -21,8 +21,10 @@ class Benchmark(AddOn):
         self.times: List[float] = list()
         # If True, we are currently benchmarking.
         self._benchmarking: bool = False
-        # The initial time.
+        # The initial time in seconds.
         self._t0: float = -1
+        # The total time elapsed in seconds.
+        self._total_time: float = 0
         """:field
         The frames per second of the previous benchmark test.
         """
@@ -45,7 +47,7 @@ class Benchmark(AddOn):
         """
 
         if self._benchmarking:
-            self._t0 = time()
+            self._t0 = perf_counter()
 
     def on_send(self, resp: List[bytes]) -> None:
         """
@@ -59,8 +61,10 @@ class Benchmark(AddOn):
 
         # Clock the benchmark.
         if self._benchmarking:
-            t1 = time()
-            self.times.append(t1 - self._t0)
+            t1 = perf_counter()
+            dt = t1 - self._t0
+            self._total_time += dt
+            self.times.append(dt)
             self._t0 = t1
 
     def start(self) -> None:
@@ -70,6 +74,7 @@ class Benchmark(AddOn):
 
         self.fps = -1
         self.times.clear()
+        self._total_time = 0
         self._benchmarking = True
 
     def stop(self) -> None:
@@ -78,4 +83,4 @@ class Benchmark(AddOn):
         """
 
         self._benchmarking = False
-        self.fps = len(self.times) / sum(self.times)
+        self.fps = len(self.times) / self._total_time
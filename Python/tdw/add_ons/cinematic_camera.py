@@ -1,7 +1,6 @@
 from enum import Enum
 from typing import List, Dict, Optional, Union
 import numpy as np
-from tdw.tdw_utils import TDWUtils
 from tdw.quaternion_utils import QuaternionUtils
 from tdw.output_data import OutputData, AvatarKinematic, ImageSensors
 from tdw.add_ons.third_person_camera_base import ThirdPersonCameraBase
@@ -59,9 +58,9 @@ class CinematicCamera(ThirdPersonCameraBase):
         """
         self.field_of_view_speed: float = field_of_view_speed
         # The current forward directional vector of the image sensor.
-        self._sensor_forward: np.array = np.array([0, 0, 0])
+        self._sensor_forward: np.array = np.zeros(3)
         # The current rotation of the image sensor.
-        self._sensor_rotation: np.array = np.array([0, 0, 0, 0])
+        self._sensor_rotation: np.array = np.zeros(4)
 
         # A target object ID or position to move towards. Can be None (no target).
         self._move_target: Optional[Union[int, Dict[str, float]]] = None
@@ -112,15 +111,15 @@ class CinematicCamera(ThirdPersonCameraBase):
             if r_id == "imse":
                 imse = ImageSensors(resp[i])
                 if imse.get_avatar_id() == self.avatar_id:
-                    # Update the rotation.
-                    self._sensor_forward = np.array(imse.get_sensor_forward(0))
-                    self._sensor_rotation = np.array(imse.get_sensor_rotation(0))
+                    # Update the rotation in place rather than allocating new arrays every frame.
+                    self._sensor_forward[:] = imse.get_sensor_forward(0)
+                    self._sensor_rotation[:] = imse.get_sensor_rotation(0)
                     # Set the field of view.
                     self._field_of_view = imse.get_sensor_field_of_view(0)
                     set_field_of_view = False
                     if self._field_of_view_target is None:
                         self._field_of_view_target = self._field_of_view
-                    f = np.linalg.norm(self._field_of_view - self._field_of_view_target)
+                    f = abs(self._field_of_view - self._field_of_view_target)
                     if f > self.field_of_view_speed:
                         if self._field_of_view > self._field_of_view_target:
                             self._field_of_view -= self.field_of_view_speed
@@ -139,7 +138,8 @@ class CinematicCamera(ThirdPersonCameraBase):
                 a = AvatarKinematic(resp[i])
                 if a.get_avatar_id() == self.avatar_id:
                     # Update the position.
-                    self.position = TDWUtils.array_to_vector3(np.array(a.get_position()))
+                    x, y, z = a.get_position()
+                    self.position = {"x": x, "y": y, "z": z}
         if self._move_target is not None:
             if self._move_target_type == _MoveTargetType.position:
                 self.commands.append({"$type": "move_avatar_towards_position",
@@ -185,8 +185,9 @@ class CinematicCamera(ThirdPersonCameraBase):
         """
 
         if relative:
-            self._move_target = TDWUtils.array_to_vector3(TDWUtils.vector3_to_array(target) +
-                                                          TDWUtils.vector3_to_array(self.position))
+            self._move_target = {"x": float(target["x"] + self.position["x"]),
+                                 "y": float(target["y"] + self.position["y"]),
+                                 "z": float(target["z"] + self.position["z"])}
         else:
             self._move_target = target
         self._move_target_type = _MoveTargetType.position
@@ -241,8 +242,9 @@ class CinematicCamera(ThirdPersonCameraBase):
         eulers[0] += target["x"]
         eulers[1] += target["y"]
         eulers[2] += target["z"]
-        self._rotate_target = TDWUtils.array_to_vector4(
-            QuaternionUtils.euler_angles_to_quaternion(np.deg2rad(eulers)))
+        # Build the command's dictionary directly from the quaternion array.
+        q = QuaternionUtils.euler_angles_to_quaternion(np.deg2rad(eulers))
+        self._rotate_target = {"x": float(q[0]), "y": float(q[1]), "z": float(q[2]), "w": float(q[3])}
         self._rotate_target_type = _RotateTargetType.rotation
 
     def rotate_to_rotation(self, target: Dict[str, float]) -> None:
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from tdw.output_data import OutputData, SegmentationColors, StaticCompositeObjects
 from tdw.add_ons.trigger_collision_manager import TriggerCollisionManager
 from tdw.container_data.container_collider_tag import ContainerColliderTag
@@ -8,6 +8,7 @@ from tdw.container_data.container_cylinder_trigger_collider import ContainerCyli
 from tdw.container_data.containment_event import ContainmentEvent
 from tdw.object_data.composite_object.composite_object_static import CompositeObjectStatic
 from tdw.controller import Controller
+from tdw.librarian import ModelRecord
 
 
 class ContainerManager(TriggerCollisionManager):
@@ -60,6 +61,8 @@ class ContainerManager(TriggerCollisionManager):
         # Get model names.
         if self._getting_model_names:
             self._getting_model_names = False
+            # Scenes often have many copies of the same model, so only search the librarians once per model name.
+            records: Dict[str, Optional[ModelRecord]] = dict()
             for i in range(len(resp) - 1):
                 r_id = OutputData.get_data_type_id(resp[i])
                 # Use the model names from SegmentationColors output data to add trigger colliders.
@@ -68,29 +71,34 @@ class ContainerManager(TriggerCollisionManager):
                     for j in range(segmentation_colors.get_num()):
                         object_id = segmentation_colors.get_object_id(j)
                         model_name = segmentation_colors.get_object_name(j).lower()
-                        # Fine the model record.
-                        for library_path in Controller.MODEL_LIBRARIANS:
-                            record = Controller.MODEL_LIBRARIANS[library_path].get_record(model_name)
-                            if record is not None:
-                                for trigger_collider_data in record.container_colliders:
-                                    if isinstance(trigger_collider_data, ContainerBoxTriggerCollider):
-                                        self.add_box_collider(object_id=object_id,
-                                                              position=trigger_collider_data.position,
-                                                              scale=trigger_collider_data.scale,
-                                                              tag=trigger_collider_data.tag)
-                                    elif isinstance(trigger_collider_data, ContainerCylinderTriggerCollider):
-                                        self.add_cylinder_collider(object_id=object_id,
-                                                                   position=trigger_collider_data.position,
-                                                                   scale=trigger_collider_data.scale,
-                                                                   tag=trigger_collider_data.tag)
-                                    elif isinstance(trigger_collider_data, ContainerSphereTriggerCollider):
-                                        self.add_sphere_collider(object_id=object_id,
-                                                                 position=trigger_collider_data.position,
-                                                                 diameter=trigger_collider_data.diameter,
-                                                                 tag=trigger_collider_data.tag)
-                                    else:
-                                        raise Exception(trigger_collider_data)
-                                break
+                        # Find the model record.
+                        if model_name not in records:
+                            records[model_name] = None
+                            for library_path in Controller.MODEL_LIBRARIANS:
+                                record = Controller.MODEL_LIBRARIANS[library_path].get_record(model_name)
+                                if record is not None:
+                                    records[model_name] = record
+                                    break
+                        record = records[model_name]
+                        if record is not None:
+                            for trigger_collider_data in record.container_colliders:
+                                if isinstance(trigger_collider_data, ContainerBoxTriggerCollider):
+                                    self.add_box_collider(object_id=object_id,
+                                                          position=trigger_collider_data.position,
+                                                          scale=trigger_collider_data.scale,
+                                                          tag=trigger_collider_data.tag)
+                                elif isinstance(trigger_collider_data, ContainerCylinderTriggerCollider):
+                                    self.add_cylinder_collider(object_id=object_id,
+                                                               position=trigger_collider_data.position,
+                                                               scale=trigger_collider_data.scale,
+                                                               tag=trigger_collider_data.tag)
+                                elif isinstance(trigger_collider_data, ContainerSphereTriggerCollider):
+                                    self.add_sphere_collider(object_id=object_id,
+                                                             position=trigger_collider_data.position,
+                                                             diameter=trigger_collider_data.diameter,
+                                                             tag=trigger_collider_data.tag)
+                                else:
+                                    raise Exception(trigger_collider_data)
                 elif r_id == "scom":
                     static_composite_objects = StaticCompositeObjects(resp[i])
                     for j in range(static_composite_objects.get_num()):
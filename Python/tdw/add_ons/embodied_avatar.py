@@ -1,7 +1,7 @@
 from typing import Dict, List, Union
+from math import sqrt
 import numpy as np
-from tdw.output_data import OutputData, AvatarSimpleBody, ImageSensors
-from tdw.tdw_utils import TDWUtils
+from tdw.output_data import AvatarSimpleBody, ImageSensors
 from tdw.add_ons.third_person_camera_base import ThirdPersonCameraBase
 from tdw.add_ons.avatar_body import AvatarBody
 from tdw.object_data.transform import Transform
@@ -33,21 +33,21 @@ class EmbodiedAvatar(ThirdPersonCameraBase):
 
         super().__init__(avatar_id=avatar_id, position=position, rotation=rotation, field_of_view=field_of_view)
         """:field
-        [Transform data](../object_data/transform.md) for the avatar.
+        [Transform data](../object_data/transform.md) for the avatar. These arrays are updated in-place every frame, so copy them if you need to keep a previous value.
         """
-        self.transform: Transform = Transform(position=np.array([0, 0, 0]),
-                                              rotation=np.array([0, 0, 0, 0]),
-                                              forward=np.array([0, 0, 0]))
+        self.transform: Transform = Transform(position=np.zeros(3),
+                                              rotation=np.zeros(4),
+                                              forward=np.zeros(3))
         """:field
-        [Rigidbody data](../object_data/rigidbody.md) for the avatar.
+        [Rigidbody data](../object_data/rigidbody.md) for the avatar. These arrays are updated in-place every frame, so copy them if you need to keep a previous value.
         """
-        self.rigidbody: Rigidbody = Rigidbody(velocity=np.array([0, 0, 0]),
-                                              angular_velocity=np.array([0, 0, 0]),
+        self.rigidbody: Rigidbody = Rigidbody(velocity=np.zeros(3),
+                                              angular_velocity=np.zeros(3),
                                               sleeping=True)
         """:field
-        The rotation of the camera as an [x, y, z, w] numpy array.
+        The rotation of the camera as an [x, y, z, w] numpy array. This array is updated in-place every frame, so copy it if you need to keep a previous value.
         """
-        self.camera_rotation: np.array = np.array([0, 0, 0, 0])
+        self.camera_rotation: np.array = np.zeros(4)
         """:field
         If True, the avatar is currently moving or turning.
         """
@@ -111,18 +111,21 @@ class EmbodiedAvatar(ThirdPersonCameraBase):
             self.commands.append({"$type": "move_avatar_forward_by",
                                   "magnitude": force,
                                   "avatar_id": self.avatar_id})
-        elif isinstance(force, dict):
-            force_arr = TDWUtils.vector3_to_array(force)
-            force_magnitude = float(np.linalg.norm(force_arr))
+        elif isinstance(force, dict) or isinstance(force, np.ndarray):
+            if isinstance(force, dict):
+                x, y, z = force["x"], force["y"], force["z"]
+            else:
+                x, y, z = float(force[0]), float(force[1]), float(force[2])
+            # This is a single 3-vector, so np.linalg.norm() would be much slower than a scalar calculation.
+            force_magnitude = sqrt(x * x + y * y + z * z)
+            # A zero vector doesn't have a direction.
+            if force_magnitude == 0:
+                raise Exception(f"Invalid force: {force}")
             self.commands.append({"$type": "apply_force_to_avatar",
                                   "magnitude": force_magnitude,
-                                  "direction": force_arr / force_magnitude,
-                                  "avatar_id": self.avatar_id})
-        elif isinstance(force, np.ndarray):
-            force_magnitude = float(np.linalg.norm(force))
-            self.commands.append({"$type": "apply_force_to_avatar",
-                                  "magnitude": force_magnitude,
-                                  "direction": force / force_magnitude,
+                                  "direction": {"x": x / force_magnitude,
+                                                "y": y / force_magnitude,
+                                                "z": z / force_magnitude},
                                   "avatar_id": self.avatar_id})
         else:
             raise Exception(f"Invalid type: {force}")
@@ -160,11 +163,11 @@ class EmbodiedAvatar(ThirdPersonCameraBase):
         :param rotation: Rotate the camera by these angles (in degrees). Keys are `"x"`, `"y"`, `"z"` and correspond to `(pitch, yaw, roll)`.
         """
 
-        for q, axis in zip(["x", "y", "z"], ["pitch", "yaw", "roll"]):
-            self.commands.append({"$type": "rotate_sensor_container_by",
-                                  "axis": axis,
-                                  "angle": rotation[q],
-                                  "avatar_id": self.avatar_id})
+        self.commands.extend([{"$type": "rotate_sensor_container_by",
+                               "axis": axis,
+                               "angle": rotation[q],
+                               "avatar_id": self.avatar_id}
+                              for q, axis in (("x", "pitch"), ("y", "yaw"), ("z", "roll"))])
 
     def look_at(self, target: Union[int, Dict[str, float], np.ndarray]) -> None:
         """
@@ -184,7 +187,7 @@ class EmbodiedAvatar(ThirdPersonCameraBase):
                                   "avatar_id": self.avatar_id})
         elif isinstance(target, np.ndarray):
             self.commands.append({"$type": "look_at_position",
-                                  "position": TDWUtils.array_to_vector3(target),
+                                  "position": {"x": float(target[0]), "y": float(target[1]), "z": float(target[2])},
                                   "avatar_id": self.avatar_id})
         else:
             raise Exception(f"Invalid type: {target}")
@@ -198,27 +201,37 @@ class EmbodiedAvatar(ThirdPersonCameraBase):
                               "avatar_id": self.avatar_id})
 
     def on_send(self, resp: List[bytes]) -> None:
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
+        avatar_id = self.avatar_id
+        # There is only one `AvatarSimpleBody` and one `ImageSensors` per avatar per frame.
+        got_avsb = False
+        got_imse = False
+        for r in resp[:-1]:
+            # Compare the raw ID bytes rather than decoding them (see also: `Controller.communicate()`).
+            r_id = r[4:8]
             # Update my state.
-            if r_id == "avsb":
-                avsb = AvatarSimpleBody(resp[i])
-                if avsb.get_avatar_id() == self.avatar_id:
-                    # Update the transform data.
-                    self.transform.position = np.array(avsb.get_position())
-                    self.transform.rotation = np.array(avsb.get_rotation())
-                    self.transform.forward = np.array(avsb.get_forward())
+            if r_id == b"avsb":
+                avsb = AvatarSimpleBody(r)
+                if avsb.get_avatar_id() == avatar_id:
+                    got_avsb = True
+                    # Update the transform data. Copy into the existing arrays rather than allocating new ones.
+                    self.transform.position[:] = avsb.get_position()
+                    self.transform.rotation[:] = avsb.get_rotation()
+                    self.transform.forward[:] = avsb.get_forward()
                     # Update the rigidbody data.
-                    self.rigidbody.velocity = np.array(avsb.get_velocity())
-                    self.rigidbody.angular_velocity = np.array(avsb.get_angular_velocity())
-                    self.rigidbody.sleeping = np.array(avsb.get_sleeping())
+                    self.rigidbody.velocity[:] = avsb.get_velocity()
+                    self.rigidbody.angular_velocity[:] = avsb.get_angular_velocity()
+                    sleeping = bool(avsb.get_sleeping())
+                    self.rigidbody.sleeping = sleeping
                     # Update whether the avatar is moving.
-                    self.is_moving = not self.rigidbody.sleeping
+                    self.is_moving = not sleeping
             # Update the rotation of the camera.
-            elif r_id == "imse":
-                imse = ImageSensors(resp[i])
-                if imse.get_avatar_id() == self.avatar_id:
-                    self.camera_rotation = np.array(imse.get_sensor_rotation(0))
+            elif r_id == b"imse":
+                imse = ImageSensors(r)
+                if imse.get_avatar_id() == avatar_id:
+                    got_imse = True
+                    self.camera_rotation[:] = imse.get_sensor_rotation(0)
+            if got_avsb and got_imse:
+                break
 
     def _get_avatar_type(self) -> str:
         return "A_Simple_Body"
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 import re
 from json import loads
 from pathlib import Path
@@ -25,6 +25,9 @@ class Floorplan(AddOn):
     ```
     """
 
+    # The parsed floorplan layouts. This is loaded the first time `init_scene()` is called.
+    _FLOORPLAN_LAYOUTS: Optional[dict] = None
+
     def __init__(self):
         """
         (no parameters)
@@ -62,8 +65,11 @@ class Floorplan(AddOn):
         else:
             raise Exception(f"Invalid scene: {scene}")
         layout_index = str(layout)
-        floorplans = loads(Path(resource_filename(__name__, "floorplan_layouts.json")).
-                           read_text(encoding="utf-8"))
+        # Parse the layouts file only once.
+        if Floorplan._FLOORPLAN_LAYOUTS is None:
+            Floorplan._FLOORPLAN_LAYOUTS = loads(Path(resource_filename(__name__, "floorplan_layouts.json")).
+                                                 read_text(encoding="utf-8"))
+        floorplans = Floorplan._FLOORPLAN_LAYOUTS
         if layout_index not in floorplans[scene_index]:
             raise Exception(f"Layout not found: {layout_index}")
 
@@ -80,14 +86,14 @@ class Floorplan(AddOn):
                           "intensity": 0.175},
                          {"$type": "set_ambient_occlusion_thickness_modifier",
                           "thickness": 3.5}]
-        # Add objects.
+        # Add objects. Copy the Vector3 dictionaries so that the commands don't share them with the cached layouts.
         for o in objects:
             object_id = Controller.get_unique_id()
             self.commands.extend(Controller.get_add_physics_object(model_name=o["name"],
                                                                    library=o["library"],
-                                                                   position=o["position"],
-                                                                   rotation=o["rotation"],
-                                                                   scale_factor=o["scale_factor"],
+                                                                   position=dict(o["position"]),
+                                                                   rotation=dict(o["rotation"]),
+                                                                   scale_factor=dict(o["scale_factor"]),
                                                                    kinematic=o["kinematic"],
                                                                    gravity=o["gravity"],
                                                                    object_id=object_id))
@@ -101,4 +101,7 @@ class InteriorSceneLighting(AddOn):
         else:
             if rng is None:
                 rng: np.random.RandomState = np.random.RandomState()
-            return rng.choice(list(InteriorSceneLighting.SKYBOX_NAMES_AND_POST_EXPOSURE_VALUES.keys()))
+            # Pick a random index rather than using `rng.choice()`, which converts the list to a numpy array and returns a `numpy.str_`.
+            # This selects the same skybox as `rng.choice()` for a given random seed.
+            hdri_skyboxes = list(InteriorSceneLighting.SKYBOX_NAMES_AND_POST_EXPOSURE_VALUES.keys())
+            return hdri_skyboxes[rng.randint(0, len(hdri_skyboxes))]
@@ -1,6 +1,5 @@
 from typing import List, Union, Callable, Optional, Dict
-from tdw.output_data import OutputData
-from tdw.output_data import Keyboard as KBoard
+from tdw.output_data import OutputData, Keyboard as KBoard
 from tdw.add_ons.add_on import AddOn
 
 
@@ -1,6 +1,6 @@
 from typing import List, Dict
 from abc import ABC, abstractmethod
-import numpy as np
+import math
 from tdw.add_ons.model_verifier.model_tests.model_test import ModelTest
 from tdw.librarian import ModelRecord
 from tdw.tdw_utils import TDWUtils
@@ -91,15 +91,19 @@ class RotateObjectTest(ModelTest, ABC):
         # Continue to rotate.
         else:
             self._angle += RotateObjectTest.DELTA_THETA
-            rad = np.radians(self._angle)
+            rad = math.radians(self._angle)
+            cos = math.cos(rad)
+            sin = math.sin(rad)
+            p = RotateObjectTest.AVATAR_POSITION
+            # Both axes rotate the (x, z) position of the avatar. Roll maps the rotated z value to y.
+            x = cos * p["x"] - sin * p["z"]
+            rotated = sin * p["x"] + cos * p["z"]
             if self._axis == "yaw":
-                x = np.cos(rad) * RotateObjectTest.AVATAR_POSITION["x"] - np.sin(rad) * RotateObjectTest.AVATAR_POSITION["z"]
-                y = RotateObjectTest.AVATAR_POSITION["y"]
-                z = np.sin(rad) * RotateObjectTest.AVATAR_POSITION["x"] + np.cos(rad) * RotateObjectTest.AVATAR_POSITION["z"]
+                y = p["y"]
+                z = rotated
             else:
-                x = np.cos(rad) * RotateObjectTest.AVATAR_POSITION["x"] - np.sin(rad) * RotateObjectTest.AVATAR_POSITION["z"]
-                y = (np.sin(rad) * RotateObjectTest.AVATAR_POSITION["x"] + np.cos(rad) * RotateObjectTest.AVATAR_POSITION["z"]) + RotateObjectTest.AVATAR_POSITION["y"]
-                z = RotateObjectTest.AVATAR_POSITION["z"]
+                y = rotated + p["y"]
+                z = p["z"]
 
             return [{"$type": "teleport_avatar_to",
                      "position": {"x": x, "y": y, "z": z}},
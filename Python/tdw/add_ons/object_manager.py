@@ -143,17 +143,51 @@ class ObjectManager(AddOn):
                  "frequency": self._send_transforms}]
 
     def on_send(self, resp: List[bytes]) -> None:
-        # Cache static data.
-        if not self._cached_static_data:
-            self._cached_static_data = True
-            # Sort the static output data by object ID.
-            segmentation_colors: Dict[int, np.array] = dict()
-            names: Dict[int, str] = dict()
-            static_rigidbodies: Dict[int, _StaticRigidbody] = dict()
-            sizes: Dict[int, np.array] = dict()
-            categories: Dict[int, str] = dict()
-            for i in range(len(resp) - 1):
-                r_id = OutputData.get_data_type_id(resp[i])
+        # Cache static data on the first frame. This is read in the same pass over `resp` as the dynamic data.
+        cache_static_data = not self._cached_static_data
+        self._cached_static_data = True
+        # Sort the static output data by object ID.
+        segmentation_colors: Dict[int, np.array] = dict()
+        names: Dict[int, str] = dict()
+        static_rigidbodies: Dict[int, _StaticRigidbody] = dict()
+        sizes: Dict[int, np.array] = dict()
+        categories: Dict[int, str] = dict()
+        # Set dynamic data.
+        self.transforms.clear()
+        self.rigidbodies.clear()
+        self.bounds.clear()
+        for i in range(len(resp) - 1):
+            r_id = OutputData.get_data_type_id(resp[i])
+            if r_id == "tran":
+                tran = Transforms(resp[i])
+                for j in range(tran.get_num()):
+                    self.transforms[tran.get_id(j)] = Transform(position=np.array(tran.get_position(j)),
+                                                                rotation=np.array(tran.get_rotation(j)),
+                                                                forward=np.array(tran.get_forward(j)))
+            elif r_id == "rigi":
+                rigi = Rigidbodies(resp[i])
+                for j in range(rigi.get_num()):
+                    self.rigidbodies[rigi.get_id(j)] = Rigidbody(velocity=rigi.get_velocity(j),
+                                                                 angular_velocity=rigi.get_angular_velocity(j),
+                                                                 sleeping=rigi.get_sleeping(j))
+            elif r_id == "boun":
+                boun = Bounds(resp[i])
+                for j in range(boun.get_num()):
+                    object_id = boun.get_id(j)
+                    bound = Bound(front=np.array(boun.get_front(j)),
+                                  back=np.array(boun.get_back(j)),
+                                  left=np.array(boun.get_left(j)),
+                                  right=np.array(boun.get_right(j)),
+                                  top=np.array(boun.get_top(j)),
+                                  bottom=np.array(boun.get_bottom(j)),
+                                  center=np.array(boun.get_center(j)))
+                    self.bounds[object_id] = bound
+                    # Derive the size from the bound points that were just read instead of reading them again.
+                    if cache_static_data:
+                        sizes[object_id] = np.array([abs(float(bound.right[0] - bound.left[0])),
+                                                     abs(float(bound.top[1] - bound.bottom[1])),
+                                                     abs(float(bound.front[2] - bound.back[2]))])
+            elif cache_static_data:
                 # Get the name and the segmentation color.
                 if r_id == "segm":
                     segm = SegmentationColors(resp[i])
@@ -162,12 +196,6 @@ class ObjectManager(AddOn):
                         segmentation_colors[object_id] = np.array(segm.get_object_color(j))
                         names[object_id] = segm.get_object_name(j).lower()
                         categories[object_id] = segm.get_object_category(j)
-                elif r_id == "boun":
-                    boun = Bounds(resp[i])
-                    for j in range(boun.get_num()):
-                        sizes[boun.get_id(j)] = np.array([float(np.abs(boun.get_right(j)[0] - boun.get_left(j)[0])),
-                                                          float(np.abs(boun.get_top(j)[1] - boun.get_bottom(j)[1])),
-                                                          float(np.abs(boun.get_front(j)[2] - boun.get_back(j)[2]))])
                 elif r_id == "srig":
                     srig = StaticRigidbodies(resp[i])
                     for j in range(srig.get_num()):
@@ -180,7 +208,8 @@ class ObjectManager(AddOn):
                     cate = Categories(resp[i])
                     for j in range(cate.get_num_categories()):
                         self.categories[cate.get_category_name(j)] = np.array(cate.get_category_color(j))
-            # Cache the sorted data.
+        # Cache the sorted data.
+        if cache_static_data:
             for object_id in segmentation_colors:
                 self.objects_static[object_id] = ObjectStatic(object_id=object_id,
                                                               name=names[object_id],
@@ -192,34 +221,6 @@ class ObjectManager(AddOn):
                                                               bounciness=static_rigidbodies[object_id].bounciness,
                                                               size=sizes[object_id],
                                                               category=categories[object_id])
-        # Set dynamic data.
-        self.transforms.clear()
-        self.rigidbodies.clear()
-        self.bounds.clear()
-        for i in range(len(resp) - 1):
-            r_id = OutputData.get_data_type_id(resp[i])
-            if r_id == "tran":
-                tran = Transforms(resp[i])
-                for j in range(tran.get_num()):
-                    self.transforms[tran.get_id(j)] = Transform(position=np.array(tran.get_position(j)),
-                                                                rotation=np.array(tran.get_rotation(j)),
-                                                                forward=np.array(tran.get_forward(j)))
-            elif r_id == "rigi":
-                rigi = Rigidbodies(resp[i])
-                for j in range(rigi.get_num()):
-                    self.rigidbodies[rigi.get_id(j)] = Rigidbody(velocity=rigi.get_velocity(j),
-                                                                 angular_velocity=rigi.get_angular_velocity(j),
-                                                                 sleeping=rigi.get_sleeping(j))
-            elif r_id == "boun":
-                boun = Bounds(resp[i])
-                for j in range(boun.get_num()):
-                    self.bounds[boun.get_id(j)] = Bound(front=np.array(boun.get_front(j)),
-                                                        back=np.array(boun.get_back(j)),
-                                                        left=np.array(boun.get_left(j)),
-                                                        right=np.array(boun.get_right(j)),
-                                                        top=np.array(boun.get_top(j)),
-                                                        bottom=np.array(boun.get_bottom(j)),
-                                                        center=np.array(boun.get_center(j)))
 
     def reset(self) -> None:
         """
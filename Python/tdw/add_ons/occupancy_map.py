@@ -1,6 +1,7 @@
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Set
+from collections import deque
 import numpy as np
-from tdw.output_data import OutputData, Raycast, Overlap
+from tdw.output_data import Raycast, Overlap
 from tdw.add_ons.add_on import AddOn
 from tdw.scene_data.scene_bounds import SceneBounds
 
@@ -41,52 +42,14 @@ class OccupancyMap(AddOn):
         self._occupancy_map_size: Tuple[int, int] = (0, 0)
         # Ignore these objects when generating the occupancy map.
         self._ignore_objects: List[int] = list()
+        # The x and z coordinates of each cell. These don't change until the scene bounds are reset.
+        self._xs: List[float] = list()
+        self._zs: List[float] = list()
 
     def get_initialization_commands(self) -> List[dict]:
         return [{"$type": "send_scene_regions"}]
 
     def on_send(self, resp: List[bytes]) -> None:
-        def __get_islands() -> List[List[Tuple[int, int]]]:
-            """
-            :return: A list of all islands, i.e. continuous zones of traversability on the occupancy map.
-            """
-
-            # Positions that have been reviewed so far.
-            traversed: List[Tuple[int, int]] = []
-            islands: List[List[Tuple[int, int]]] = list()
-
-            for ox, oy in np.ndindex(self.occupancy_map.shape):
-                op = (ox, oy)
-                if op in traversed:
-                    continue
-                # Fill the island (a continuous zone) that position `p` belongs to.
-                to_check: List[tuple] = [op]
-                island: List[Tuple[int, int]] = list()
-                while len(to_check) > 0:
-                    # Check the next position.
-                    op = to_check.pop(0)
-                    if op[0] < 0 or op[0] >= self.occupancy_map.shape[0] or op[1] < 0 or \
-                            op[1] >= self.occupancy_map.shape[1] or \
-                            self.occupancy_map[op[0]][op[1]] != 0 or op in island:
-                        continue
-                    # Mark the position as traversed.
-                    island.append(op)
-                    # Check these neighbors.
-                    px, py = op
-                    to_check.extend([(px, py + 1),
-                                     (px + 1, py + 1),
-                                     (px + 1, py),
-                                     (px + 1, py - 1),
-                                     (px, py - 1),
-                                     (px - 1, py - 1),
-                                     (px - 1, py),
-                                     (px - 1, py + 1)])
-                if len(island) > 0:
-                    for island_position in island:
-                        traversed.append(island_position)
-                    islands.append(island)
-            return islands
-
         # Set the scene bounds.
         if self.scene_bounds is None:
             self.scene_bounds = SceneBounds(resp=resp)
@@ -96,48 +59,54 @@ class OccupancyMap(AddOn):
                                           dtype=int)
             # Get all of the positions that are actually in the environment.
             hit_env: Dict[int, bool] = dict()
-            # Get all of the overlaps to determine if there was an object.
-            hit_obj: Dict[int, bool] = dict()
             # The IDs of each object in the overlap.
             hit_obj_ids: Dict[int, np.array] = dict()
             hit_walls: Dict[int, bool] = dict()
-            for i in range(len(resp) - 1):
-                r_id = OutputData.get_data_type_id(resp[i])
-                if r_id == "rayc":
-                    raycast = Raycast(resp[i])
+            # There is one raycast and one overlap per cell, so compare the raw ID bytes rather than decoding them.
+            for r in resp[:-1]:
+                r_id = r[4:8]
+                if r_id == b"rayc":
+                    raycast = Raycast(r)
                     hit_env[raycast.get_raycast_id()] = raycast.get_hit()
-                elif r_id == "over":
-                    overlap = Overlap(resp[i])
+                elif r_id == b"over":
+                    overlap = Overlap(r)
                     overlap_id = overlap.get_id()
-                    hit_obj[overlap_id] = len(overlap.get_object_ids()) > 0
                     hit_obj_ids[overlap_id] = overlap.get_object_ids()
                     hit_walls[overlap_id] = overlap.get_walls()
 
-            for cast_id in hit_env:
-                idx = cast_id % 10000
-                idz = int((cast_id - (cast_id % 10000)) / 10000)
+            occupancy_map = self.occupancy_map
+            ignore_objects = self._ignore_objects
+            for cast_id, hit in hit_env.items():
+                idz, idx = divmod(cast_id, 10000)
                 # The position is outside of the environment.
-                if not hit_env[cast_id]:
-                    self.occupancy_map[idx][idz] = -1
+                if not hit:
+                    occupancy_map[idx, idz] = -1
                 # The position is occupied by at least one object that we aren't ignoring.
-                elif hit_walls[cast_id] or (hit_obj[cast_id] and len([o for o in hit_obj_ids[cast_id] if o not in self._ignore_objects]) > 0):
-                    self.occupancy_map[idx][idz] = 1
+                # Usually, no objects are ignored, so skip the per-object check.
+                elif hit_walls[cast_id] or (len(hit_obj_ids[cast_id]) > 0 and
+                                            (len(ignore_objects) == 0 or
+                                             any(o not in ignore_objects for o in hit_obj_ids[cast_id]))):
+                    occupancy_map[idx, idz] = 1
                 # The position is free.
                 else:
-                    self.occupancy_map[idx][idz] = 0
+                    occupancy_map[idx, idz] = 0
             # Assume that the edges of the occupancy map are out of bounds.
-            for ix, iy in np.ndindex(self.occupancy_map.shape):
-                if ix == 0 or ix == self.occupancy_map.shape[0] - 1 or iy == 0 or \
-                        iy == self.occupancy_map.shape[1] - 1:
-                    self.occupancy_map[ix][iy] = -1
+            self.occupancy_map[0, :] = -1
+            self.occupancy_map[-1, :] = -1
+            self.occupancy_map[:, 0] = -1
+            self.occupancy_map[:, -1] = -1
             # Sort the free positions of the occupancy map into continuous "islands".
-            # Then, sort that list of lists by length.
             # The longest list is the biggest "island" i.e. the navigable area.
-            non_navigable = list(sorted(__get_islands(), key=len))[:-1]
-            # Record non-navigable positions.
-            for n in non_navigable:
-                for p in n:
-                    self.occupancy_map[p[0]][p[1]] = -1
+            # If there is a tie, the last of the longest islands is navigable.
+            islands = self._get_islands()
+            if len(islands) > 0:
+                navigable = max(range(len(islands)), key=lambda k: (len(islands[k]), k))
+                # Record non-navigable positions.
+                for k in range(len(islands)):
+                    if k == navigable:
+                        continue
+                    for p in islands[k]:
+                        self.occupancy_map[p[0]][p[1]] = -1
 
     def generate(self, ignore_objects: List[int] = None) -> None:
         """
@@ -157,32 +126,38 @@ class OccupancyMap(AddOn):
             self._ignore_objects.clear()
         else:
             self._ignore_objects = ignore_objects
-        # Spherecast to each point.
-        x = self.scene_bounds.x_min
-        idx = 0
-        idz = 0
-        capsule_half_height = (self.scene_bounds.y_max - self.scene_bounds.y_min) / 2
-        while x < self.scene_bounds.x_max:
+        # Get the x and z coordinates of each cell. The z coordinates are the same for every x coordinate.
+        # Reuse the coordinates from the previous `generate()` call if the scene bounds haven't been reset.
+        if len(self._xs) == 0 and len(self._zs) == 0:
+            x = self.scene_bounds.x_min
+            while x < self.scene_bounds.x_max:
+                self._xs.append(x)
+                x += self._cell_size
             z = self.scene_bounds.z_min
-            idz = 0
             while z < self.scene_bounds.z_max:
+                self._zs.append(z)
+                z += self._cell_size
+        xs = self._xs
+        zs = self._zs
+        capsule_half_height = (self.scene_bounds.y_max - self.scene_bounds.y_min) / 2
+        radius = self._cell_size / 2
+        # Spherecast to each point.
+        commands = self.commands
+        for idx, x in enumerate(xs):
+            for idz, z in enumerate(zs):
                 # Create an overlap sphere to determine if the cell is occupied.
                 # Cast a ray to determine if the cell has a floor.
                 cast_id = idx + (idz * 10000)
-                self.commands.extend([{"$type": "send_overlap_capsule",
-                                       "end": {"x": x, "y": capsule_half_height, "z": z},
-                                       "radius": self._cell_size / 2,
-                                       "position": {"x": x, "y": -capsule_half_height, "z": z},
-                                       "id": cast_id},
-                                      {"$type": "send_raycast",
-                                       "origin": {"x": x, "y": OccupancyMap._RAYCAST_Y, "z": z},
-                                       "destination": {"x": x, "y": -1, "z": z},
-                                       "id": cast_id}])
-                z += self._cell_size
-                idz += 1
-            x += self._cell_size
-            idx += 1
-        self._occupancy_map_size = (idx, idz)
+                commands.append({"$type": "send_overlap_capsule",
+                                 "end": {"x": x, "y": capsule_half_height, "z": z},
+                                 "radius": radius,
+                                 "position": {"x": x, "y": -capsule_half_height, "z": z},
+                                 "id": cast_id})
+                commands.append({"$type": "send_raycast",
+                                 "origin": {"x": x, "y": OccupancyMap._RAYCAST_Y, "z": z},
+                                 "destination": {"x": x, "y": -1, "z": z},
+                                 "id": cast_id})
+        self._occupancy_map_size = (len(xs), len(zs) if len(xs) > 0 else 0)
 
     def get_occupancy_position(self, i: int, j: int) -> Tuple[float, float]:
         """
@@ -223,15 +198,15 @@ class OccupancyMap(AddOn):
 
         if self.occupancy_map is None:
             raise Exception("The occupancy map hasn't been generated and initialized (see documentation).")
-        for idx, idy in np.ndindex(self.occupancy_map.shape):
-            if self.occupancy_map[idx][idy] != 0:
-                continue
-            x, z = self.get_occupancy_position(idx, idy)
-            self.commands.append({"$type": "add_position_marker",
-                                  "position": {"x": x, "y": 0.05, "z": z},
-                                  "scale": self._cell_size * 0.9,
-                                  "color": {"r": 0, "g": 0, "b": 1, "a": 1},
-                                  "shape": "square"})
+        # Convert the indices of every free cell to worldspace coordinates in one array operation.
+        origin = np.array([self.scene_bounds.x_min, self.scene_bounds.z_min])
+        positions = (origin + np.argwhere(self.occupancy_map == 0) * self._cell_size).tolist()
+        scale = self._cell_size * 0.9
+        self.commands.extend([{"$type": "add_position_marker",
+                               "position": {"x": x, "y": 0.05, "z": z},
+                               "scale": scale,
+                               "color": {"r": 0, "g": 0, "b": 1, "a": 1},
+                               "shape": "square"} for x, z in positions])
 
     def hide(self) -> None:
         """
@@ -250,3 +225,45 @@ class OccupancyMap(AddOn):
         self.scene_bounds = None
         self._occupancy_map_size = (0, 0)
         self._ignore_objects.clear()
+        self._xs.clear()
+        self._zs.clear()
+
+    def _get_islands(self) -> List[List[Tuple[int, int]]]:
+        """
+        :return: A list of all islands, i.e. continuous zones of traversability on the occupancy map.
+        """
+
+        # Positions that have been reviewed so far.
+        traversed: Set[Tuple[int, int]] = set()
+        islands: List[List[Tuple[int, int]]] = list()
+
+        for ox, oy in np.ndindex(self.occupancy_map.shape):
+            op = (ox, oy)
+            if op in traversed:
+                continue
+            # Fill the island (a continuous zone) that position `p` belongs to.
+            to_check = deque([op])
+            island: List[Tuple[int, int]] = list()
+            while len(to_check) > 0:
+                # Check the next position.
+                op = to_check.popleft()
+                if op[0] < 0 or op[0] >= self.occupancy_map.shape[0] or op[1] < 0 or \
+                        op[1] >= self.occupancy_map.shape[1] or \
+                        self.occupancy_map[op[0]][op[1]] != 0 or op in traversed:
+                    continue
+                # Mark the position as traversed. Islands never touch, so this also covers `op in island`.
+                island.append(op)
+                traversed.add(op)
+                # Check these neighbors.
+                px, py = op
+                to_check.extend([(px, py + 1),
+                                 (px + 1, py + 1),
+                                 (px + 1, py),
+                                 (px + 1, py - 1),
+                                 (px, py - 1),
+                                 (px - 1, py - 1),
+                                 (px - 1, py),
+                                 (px - 1, py + 1)])
+            if len(island) > 0:
+                islands.append(island)
+        return islands
@@ -73,6 +73,9 @@ class PhysicsAudioRecorder(AddOn):
                 # Check if the simulation is totally silent (there might be Resonance Audio reverb).
                 if not playing_audio and np.max(audio_sources.get_samples()) > 0:
                     playing_audio = True
+            # Once an object is moving or audio is playing, the recording won't stop this frame, so there's no need to check the rest of the output data.
+            if not sleeping or playing_audio:
+                break
         if sleeping and not playing_audio:
             self.stop()
 
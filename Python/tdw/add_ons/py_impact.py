@@ -1,4 +1,5 @@
 from time import time
+from bisect import bisect_left
 from os import urandom
 import base64
 import math
@@ -11,7 +12,7 @@ import scipy.signal as sg
 from scipy.ndimage import gaussian_filter1d, uniform_filter1d
 from pydub import AudioSegment
 from tdw.tdw_utils import TDWUtils
-from tdw.librarian import ModelRecord
+from tdw.librarian import ModelRecord, MaterialLibrarian, MaterialRecord
 from tdw.output_data import OutputData, Rigidbodies, StaticRobot, SegmentationColors, StaticRigidbodies, \
     RobotJointVelocities, StaticOculusTouch, AudioSourceDone, Bounds
 from tdw.physics_audio.audio_material import AudioMaterial
@@ -26,7 +27,6 @@ from tdw.physics_audio.scrape_material import ScrapeMaterial
 from tdw.object_data.rigidbody import Rigidbody
 from tdw.audio_constants import SAMPLE_RATE, CHANNELS, SAMPLE_WIDTH
 from tdw.add_ons.collision_manager import CollisionManager
-from tdw.librarian import MaterialLibrarian
 
 
 class PyImpact(CollisionManager):
@@ -140,6 +140,12 @@ class PyImpact(CollisionManager):
     FLOOR_MASS: int = 100
     # Visual material librarian used for scrape surfaces.
     __VISUAL_MATERIAL_LIBRARIAN: MaterialLibrarian = MaterialLibrarian("materials_high.json")
+    # The upper bound of the sum of an object's extents per size bucket, and the size of each bucket.
+    # Nothing can have a sum <= 0.02 without also being <= 0.1, so there is never a size of 1.
+    __SIZE_THRESHOLDS: Tuple[float, ...] = (0.1, 0.5, 1, 3, 10)
+    __SIZES: Tuple[int, ...] = (0, 2, 3, 4, 5, 6)
+    # Parsed mode data per audio material and size. This is loaded from disk once and shared by every PyImpact.
+    __MATERIAL_DATA: Optional[Dict[str, dict]] = None
 
     def __init__(self, initial_amp: float = 0.5, prevent_distortion: bool = True, logging: bool = False,
                  static_audio_data_overrides: Dict[int, ObjectAudioStatic] = None,
@@ -199,18 +205,24 @@ class PyImpact(CollisionManager):
         self.floor: AudioMaterial = floor
 
         """:field
-        Cached material data.
+        Cached material data. The inner dictionaries are shared by every PyImpact instance, so don't modify them in-place.
         """
-        self.material_data: Dict[str, dict] = {}
-        material_list = ["ceramic", "wood_hard", "wood_medium", "wood_soft", "metal", "glass", "paper", "cardboard",
-                         "leather", "fabric", "plastic_hard", "plastic_soft_foam", "rubber", "stone"]
-        for mat in material_list:
-            for i in range(6):
-                # Load the JSON data.
-                mat_name = mat + "_" + str(i)
-                path = mat_name + "_mm"
-                data = json.loads(Path(resource_filename(__name__, f"py_impact/material_data/{path}.json")).read_text())
-                self.material_data.update({mat_name: data})
+        if PyImpact.__MATERIAL_DATA is None:
+            material_data: Dict[str, dict] = dict()
+            # Resolve the package directory once rather than once per file.
+            material_data_directory = Path(resource_filename(__name__, "py_impact/material_data"))
+            material_list = ["ceramic", "wood_hard", "wood_medium", "wood_soft", "metal", "glass", "paper", "cardboard",
+                             "leather", "fabric", "plastic_hard", "plastic_soft_foam", "rubber", "stone"]
+            for mat in material_list:
+                for i in range(6):
+                    # Load the JSON data.
+                    mat_name = mat + "_" + str(i)
+                    path = mat_name + "_mm"
+                    data = json.loads(material_data_directory.joinpath(f"{path}.json").read_text())
+                    material_data[mat_name] = data
+            # Only cache the data once every file has been parsed.
+            PyImpact.__MATERIAL_DATA = material_data
+        self.material_data: Dict[str, dict] = dict(PyImpact.__MATERIAL_DATA)
         """:field
         Cached scrape surface data.
         """
@@ -447,10 +459,10 @@ class PyImpact(CollisionManager):
         :return: The audio modes.
         """
         data = self.material_data[material] if isinstance(material, str) else self.material_data[material.name]
-        # Load the mode properties.
-        f = -1
-        p = -1
-        t = -1
+        # Load the mode properties. Append to lists and convert them to arrays once at the end.
+        f: List[float] = list()
+        p: List[float] = list()
+        t: List[float] = list()
         for jm in range(0, 10):
             jf = 0
             while jf < 20:
@@ -459,15 +471,10 @@ class PyImpact(CollisionManager):
             jt = 0
             while jt < 0.001:
                 jt = data["rt"][jm] + self.rng.normal(0, data["rt"][jm] / 10)
-            if jm == 0:
-                f = jf
-                p = jp
-                t = jt * 1e3
-            else:
-                f = np.append(f, jf)
-                p = np.append(p, jp)
-                t = np.append(t, jt * 1e3)
-        return Modes(f, p, t)
+            f.append(jf)
+            p.append(jp)
+            t.append(jt * 1e3)
+        return Modes(np.array(f), np.array(p), np.array(t))
 
     def get_impact_sound(self, velocity: np.array, contact_normals: List[np.array],
                          primary_id: int, primary_material: str, primary_amp: float, primary_mass: float,
@@ -504,20 +511,17 @@ class PyImpact(CollisionManager):
                                                                                        primary_material),
                                                                                    amp=primary_amp * self.initial_amp)})
         # Unpack useful parameters.
-        speed = np.square(velocity)
-        speed = np.sum(speed)
-        speed = math.sqrt(speed)
-        nvel = velocity / np.linalg.norm(velocity)
-        nspd = []
-        for jc in range(len(contact_normals)):
-            tmp = np.asarray(contact_normals[jc])
-            tmp = tmp / np.linalg.norm(tmp)
-            tmp = np.arccos(np.clip(np.dot(tmp, nvel), -1.0, 1.0))
-            # Scale the speed by the angle (i.e. we want speed Normal to the surface).
-            tmp = speed * np.cos(tmp)
-            nspd.append(tmp)
-        normal_speed = np.mean(nspd)
-        mass = np.min([primary_mass, secondary_mass])
+        # This is a single 3-vector, so a dot product is faster than np.square() + np.sum() or np.linalg.norm().
+        speed = math.sqrt(velocity @ velocity)
+        # The speed is the magnitude of the velocity, so there's no need to calculate the norm again.
+        nvel = velocity / speed
+        # Normalize all of the contact normals at once.
+        normals = np.asarray(contact_normals, dtype=float).reshape(-1, 3)
+        normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+        angles = np.arccos(np.clip(normals @ nvel, -1.0, 1.0))
+        # Scale the speed by the angle (i.e. we want speed Normal to the surface).
+        normal_speed = np.mean(speed * np.cos(angles))
+        mass = min(primary_mass, secondary_mass)
 
         # Re-scale the amplitude.
         if self.object_modes[secondary_id][primary_id].count == 0:
@@ -540,8 +544,11 @@ class PyImpact(CollisionManager):
             # Adjust modes here so that two successive impacts are not identical.
             modes_1 = self.object_modes[secondary_id][primary_id].obj1_modes
             modes_2 = self.object_modes[secondary_id][primary_id].obj2_modes
-            modes_1.powers = modes_1.powers + self.rng.normal(0, 2, len(modes_1.powers))
-            modes_2.powers = modes_2.powers + self.rng.normal(0, 2, len(modes_2.powers))
+            # Draw the jitter for both objects at once. This yields the same values as two sequential draws.
+            num_powers_1 = len(modes_1.powers)
+            jitter = self.rng.normal(0, 2, num_powers_1 + len(modes_2.powers))
+            modes_1.powers = modes_1.powers + jitter[:num_powers_1]
+            modes_2.powers = modes_2.powers + jitter[num_powers_1:]
             sound = PyImpact._synth_impact_modes(modes_1, modes_2, mass, primary_resonance, secondary_resonance)
             self.object_modes[secondary_id][primary_id].obj1_modes = modes_1
             self.object_modes[secondary_id][primary_id].obj2_modes = modes_2
@@ -628,13 +635,10 @@ class PyImpact(CollisionManager):
         """
 
         # Unpack material names.
-        for jmat in AudioMaterial:
-            if mat1 == jmat:
-                tmp1 = jmat
-                mat1 = tmp1.name
-            if mat2 == jmat:
-                tmp2 = jmat
-                mat2 = tmp2.name
+        if isinstance(mat1, AudioMaterial):
+            mat1 = mat1.name
+        if isinstance(mat2, AudioMaterial):
+            mat2 = mat2.name
         # Sample modes of object1.
         modes_1 = self.object_modes[id2][id1].obj1_modes
         modes_2 = self.object_modes[id2][id1].obj2_modes
@@ -768,7 +772,7 @@ class PyImpact(CollisionManager):
             self._scrape_events_count[scrape_key] = scrape_event_count
 
         # Get magnitude of velocity of the scraping object.
-        mag = min(np.linalg.norm(velocity), PyImpact.SCRAPE_MAX_VELOCITY)
+        mag = min(math.sqrt(velocity @ velocity), PyImpact.SCRAPE_MAX_VELOCITY)
 
         # Cache the starting velocity.
         if scrape_event_count == 0:
@@ -798,8 +802,8 @@ class PyImpact(CollisionManager):
         if scrape_material not in self.scrape_surface_data:
             scrape_surface = np.load(str(
                 Path(resource_filename(__name__, f"py_impact/scrape_surfaces/{scrape_material.name}.npy")).resolve()))
-            for i in range(2):
-                scrape_surface = np.append(scrape_surface, scrape_surface)
+            # Repeat the surface four times in a single allocation.
+            scrape_surface = np.tile(scrape_surface, 4)
             #   Load the surface texture as a 1D vector
             #   Create surface texture of desired length
             #   Calculate first and second derivatives by first principles
@@ -914,7 +918,7 @@ class PyImpact(CollisionManager):
         # Convolve with force, with contact time scaled by the object mass.
         max_t = 0.001 * mass
         # A contact time over 2ms is unphysically long.
-        max_t = np.min([max_t, 2e-3])
+        max_t = min(max_t, 2e-3)
         n_pts = int(np.ceil(max_t * 44100))
         tt = np.linspace(0, np.pi, n_pts)
         frc = np.sin(tt)
@@ -936,20 +940,7 @@ class PyImpact(CollisionManager):
             s = sum(TDWUtils.get_bounds_extents(bounds=model.bounds))
         else:
             raise Exception(f"Invalid extents: {model}")
-        if s <= 0.1:
-            return 0
-        elif s <= 0.02:
-            return 1
-        elif s <= 0.5:
-            return 2
-        elif s <= 1:
-            return 3
-        elif s <= 3:
-            return 4
-        elif s <= 10:
-            return 5
-        else:
-            return 6
+        return PyImpact.__SIZES[bisect_left(PyImpact.__SIZE_THRESHOLDS, s)]
 
     def reset(self, initial_amp: float = 0.5, static_audio_data_overrides: Dict[int, ObjectAudioStatic] = None,
               scrape_objects: Dict[int, ScrapeModel] = None) -> None:
@@ -1035,13 +1026,15 @@ class PyImpact(CollisionManager):
         object_bouncinesses: Dict[int, float] = dict()
         extents: Dict[int, np.array] = dict()
         vr_nodes: List[ObjectAudioStatic] = list()
+        # Many scrape surfaces share the same visual material. Look up and add each material only once.
+        visual_materials: Dict[str, MaterialRecord] = dict()
         for i in range(len(resp) - 1):
             r_id = OutputData.get_data_type_id(resp[i])
             if r_id == "boun":
                 boun = Bounds(resp[i])
                 for j in range(boun.get_num()):
                     extents[boun.get_id(j)] = TDWUtils.get_bounds_extents(bounds=boun, index=j)
-            if r_id == "segm":
+            elif r_id == "segm":
                 segm = SegmentationColors(resp[i])
                 for j in range(segm.get_num()):
                     object_id = segm.get_object_id(j)
@@ -1053,18 +1046,22 @@ class PyImpact(CollisionManager):
                         if object_id not in self._scrape_objects:
                             self._scrape_objects[object_id] = DEFAULT_SCRAPE_MODELS[model_name]
                         # Add the visual material.
-                        material_record = PyImpact.__VISUAL_MATERIAL_LIBRARIAN.get_record(
-                            name=self._scrape_objects[object_id].visual_material)
-                        self.commands.append({"$type": "add_material",
-                                              "name": material_record.name,
-                                              "url": material_record.get_url()})
+                        visual_material = self._scrape_objects[object_id].visual_material
+                        if visual_material in visual_materials:
+                            material_record = visual_materials[visual_material]
+                        else:
+                            material_record = PyImpact.__VISUAL_MATERIAL_LIBRARIAN.get_record(name=visual_material)
+                            visual_materials[visual_material] = material_record
+                            self.commands.append({"$type": "add_material",
+                                                  "name": material_record.name,
+                                                  "url": material_record.get_url()})
                         # Set the visual material.
-                        for sub_object in self._scrape_objects[object_id].sub_objects:
-                            self.commands.append({"$type": "set_visual_material",
-                                                  "material_index": sub_object.material_index,
-                                                  "material_name": material_record.name,
-                                                  "object_name": sub_object.name,
-                                                  "id": object_id})
+                        self.commands.extend([{"$type": "set_visual_material",
+                                               "material_index": sub_object.material_index,
+                                               "material_name": material_record.name,
+                                               "object_name": sub_object.name,
+                                               "id": object_id}
+                                              for sub_object in self._scrape_objects[object_id].sub_objects])
             elif r_id == "srob":
                 srob = StaticRobot(resp[i])
                 for j in range(srob.get_num_joints()):
@@ -1113,10 +1110,13 @@ class PyImpact(CollisionManager):
                 need_to_derive.append(object_id)
         current_values = self._static_audio_data.values()
         derived_data: Dict[int, ObjectAudioStatic] = dict()
+        # Count the objects per category once instead of scanning every object's category for each derived object.
+        num_objects_per_category: Dict[str, int] = dict()
+        for category in categories.values():
+            num_objects_per_category[category] = num_objects_per_category.get(category, 0) + 1
         for object_id in need_to_derive:
             # Fallback option: comparable objects in the same category.
-            objects_in_same_category = [o for o in categories if categories[o] == categories[object_id]]
-            if len(objects_in_same_category) > 0:
+            if num_objects_per_category.get(categories[object_id], 0) > 0:
                 amps: List[float] = [a.amp for a in current_values]
                 materials: List[AudioMaterial] = [a.material for a in current_values]
                 resonances: List[float] = [a.resonance for a in current_values]
@@ -1,4 +1,4 @@
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 from overrides import final
 import numpy as np
 from tdw.controller import Controller
@@ -40,6 +40,15 @@ class Robot(RobotBase):
     ```
     """
 
+    # The command used to set each type of joint's target.
+    _SET_TARGET_COMMANDS: Dict[JointType, str] = {JointType.spherical: "set_spherical_target",
+                                                  JointType.revolute: "set_revolute_target",
+                                                  JointType.prismatic: "set_prismatic_target"}
+    # The command and the key of the force value used to add a torque or force to each type of joint.
+    _ADD_FORCE_COMMANDS: Dict[JointType, Tuple[str, str]] = {JointType.spherical: ("add_torque_to_spherical", "torque"),
+                                                            JointType.revolute: ("add_torque_to_revolute", "torque"),
+                                                            JointType.prismatic: ("add_force_to_prismatic", "force")}
+
     def __init__(self, name: str, robot_id: int = 0, position: Dict[str, float] = None, rotation: Dict[str, float] = None,
                  source: Union[RobotLibrarian, RobotRecord, str] = None):
         """
@@ -99,23 +108,13 @@ class Robot(RobotBase):
 
         for joint_id in targets:
             joint_type = self.static.joints[joint_id].joint_type
-            if joint_type == JointType.spherical:
-                self.commands.append({"$type": "set_spherical_target",
-                                      "target": targets[joint_id],
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            elif joint_type == JointType.revolute:
-                self.commands.append({"$type": "set_revolute_target",
-                                      "target": float(targets[joint_id]),
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            elif joint_type == JointType.prismatic:
-                self.commands.append({"$type": "set_prismatic_target",
-                                      "target": float(targets[joint_id]),
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            else:
+            if joint_type not in Robot._SET_TARGET_COMMANDS:
                 raise Exception(f"Cannot set target for joint type {joint_type}")
+            # Spherical targets are Vector3 dictionaries. All other targets are floats.
+            self.commands.append({"$type": Robot._SET_TARGET_COMMANDS[joint_type],
+                                  "target": targets[joint_id] if joint_type == JointType.spherical else float(targets[joint_id]),
+                                  "joint_id": joint_id,
+                                  "id": self.robot_id})
             self.dynamic.joints[joint_id].moving = True
 
     def add_joint_forces(self, forces: Dict[int, Union[float, Dict[str, float]]]) -> None:
@@ -127,23 +126,14 @@ class Robot(RobotBase):
 
         for joint_id in forces:
             joint_type = self.static.joints[joint_id].joint_type
-            if joint_type == JointType.spherical:
-                self.commands.append({"$type": "add_torque_to_spherical",
-                                      "torque": forces[joint_id],
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            elif joint_type == JointType.revolute:
-                self.commands.append({"$type": "add_torque_to_revolute",
-                                      "torque": float(forces[joint_id]),
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            elif joint_type == JointType.prismatic:
-                self.commands.append({"$type": "add_force_to_prismatic",
-                                      "force": float(forces[joint_id]),
-                                      "joint_id": joint_id,
-                                      "id": self.robot_id})
-            else:
+            if joint_type not in Robot._ADD_FORCE_COMMANDS:
                 raise Exception(f"Cannot apply torque or force to joint type {joint_type}")
+            command_type, force_key = Robot._ADD_FORCE_COMMANDS[joint_type]
+            # Spherical torques are Vector3 dictionaries. All other torques and forces are floats.
+            self.commands.append({"$type": command_type,
+                                  force_key: forces[joint_id] if joint_type == JointType.spherical else float(forces[joint_id]),
+                                  "joint_id": joint_id,
+                                  "id": self.robot_id})
             self.dynamic.joints[joint_id].moving = True
 
     def stop_joints(self, joint_ids: List[int] = None) -> None:
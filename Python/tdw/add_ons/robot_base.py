@@ -1,7 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from overrides import final
-import numpy as np
 from tdw.robot_data.robot_static import RobotStatic
 from tdw.robot_data.robot_dynamic import RobotDynamic
 from tdw.add_ons.add_on import AddOn
@@ -162,13 +161,14 @@ class RobotBase(AddOn, ABC):
 
         if self.dynamic is not None:
             # Check which joints are still moving.
-            for joint_id in dynamic.joints:
-                dynamic.joints[joint_id].moving = False
-                for angle_0, angle_1 in zip(self.dynamic.joints[joint_id].angles, dynamic.joints[joint_id].angles):
-                    if np.linalg.norm(angle_1 - angle_0) > RobotBase.NON_MOVING:
-                        dynamic.joints[joint_id].moving = True
+            previous_joints = self.dynamic.joints
+            for joint_id, joint in dynamic.joints.items():
+                joint.moving = False
+                for angle_0, angle_1 in zip(previous_joints[joint_id].angles, joint.angles):
+                    if abs(angle_1 - angle_0) > RobotBase.NON_MOVING:
+                        joint.moving = True
                         break
         else:
-            for joint_id in dynamic.joints:
-                dynamic.joints[joint_id].moving = True
+            for joint in dynamic.joints.values():
+                joint.moving = True
         return dynamic
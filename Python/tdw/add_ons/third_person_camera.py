@@ -138,11 +138,11 @@ class ThirdPersonCamera(ThirdPersonCameraBase):
         :param rotation: Rotate the camera by these angles (in degrees). Keys are `"x"`, `"y"`, `"z"` and correspond to `(pitch, yaw, roll)`.
         """
 
-        for q, axis in zip(["x", "y", "z"], ["pitch", "yaw", "roll"]):
-            self.commands.append({"$type": "rotate_sensor_container_by",
-                                  "axis": axis,
-                                  "angle": rotation[q],
-                                  "avatar_id": self.avatar_id})
+        self.commands.extend([{"$type": "rotate_sensor_container_by",
+                               "axis": axis,
+                               "angle": rotation[q],
+                               "avatar_id": self.avatar_id}
+                              for q, axis in (("x", "pitch"), ("y", "yaw"), ("z", "roll"))])
 
     def look_at(self, target: Union[int, Dict[str, float]] = None) -> None:
         """
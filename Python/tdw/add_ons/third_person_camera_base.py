@@ -84,11 +84,11 @@ class ThirdPersonCameraBase(AddOn, ABC):
                                      "rotation": self._rotation,
                                      "avatar_id": self.avatar_id})
                 else:
-                    for q, axis in zip(["x", "y", "z"], ["pitch", "yaw", "roll"]):
-                        commands.append({"$type": "rotate_sensor_container_by",
-                                         "axis": axis,
-                                         "angle": self._rotation[q],
-                                         "avatar_id": self.avatar_id})
+                    commands.extend([{"$type": "rotate_sensor_container_by",
+                                      "axis": axis,
+                                      "angle": self._rotation[q],
+                                      "avatar_id": self.avatar_id}
+                                     for q, axis in (("x", "pitch"), ("y", "yaw"), ("z", "roll"))])
         # Set the field of view.
         if self._field_of_view is not None:
             commands.append({"$type": "set_field_of_view",
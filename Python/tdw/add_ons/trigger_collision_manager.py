@@ -1,8 +1,7 @@
 from typing import List, Dict
 from overrides import final
 from tdw.tdw_utils import TDWUtils
-from tdw.output_data import OutputData
-from tdw.output_data import TriggerCollision
+from tdw.output_data import OutputData, TriggerCollision
 from tdw.collision_data.trigger_collision_event import TriggerCollisionEvent
 from tdw.collision_data.trigger_collider_shape import TriggerColliderShape
 from tdw.add_ons.add_on import AddOn
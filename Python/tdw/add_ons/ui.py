@@ -163,10 +163,10 @@ class UI(AddOn):
             self.commands.append({"$type": "destroy_ui_canvas",
                                   "canvas_id": self._canvas_id})
         else:
-            for ui_id in self._ui_ids:
-                self.commands.append({"$type": "destroy_ui_element",
-                                      "id": ui_id,
-                                      "canvas_id": self._canvas_id})
+            canvas_id = self._canvas_id
+            self.commands.extend([{"$type": "destroy_ui_element",
+                                   "id": ui_id,
+                                   "canvas_id": canvas_id} for ui_id in self._ui_ids])
         self._ui_ids.clear()
 
     def _get_add_element(self, command_type: str, position: Dict[str, int], anchor: Tuple[float, float] = None,
@@ -65,33 +65,28 @@ class PerformanceBenchmarkController(Controller):
                      "value": png},
                     TDWUtils.create_empty_room(30, 30)]
         if boxes:
-            y = 0.5
-            # Create 100 boxes.
-            object_ids = []
-            for i in range(100):
-                commands.append({"$type": "load_primitive_from_resources",
-                                 "primitive_type": "Cube",
-                                 "id": i,
-                                 "position": {"x": 0, "y": y, "z": 0},
-                                 "orientation": {"x": 0, "y": 0, "z": 0}})
-                object_ids.append(i)
-                y += 1.5
+            # Create 100 boxes, stacked 1.5 meters apart.
+            object_ids = list(range(100))
+            commands.extend([{"$type": "load_primitive_from_resources",
+                              "primitive_type": "Cube",
+                              "id": object_id,
+                              "position": {"x": 0, "y": 0.5 + object_id * 1.5, "z": 0},
+                              "orientation": {"x": 0, "y": 0, "z": 0}} for object_id in object_ids])
             # Initialize for Obi.
             if obi:
                 obi_collision_material = CollisionMaterial()
                 commands.extend([{"$type": "destroy_obi_solver"},
                                  {"$type": "create_obi_solver"},
                                  {"$type": "create_floor_obi_colliders"}])
-                floor_material_command = {"$type": "set_floor_obi_collision_material"}
-                floor_material_command.update(obi_collision_material.to_dict())
-                commands.append(floor_material_command)
+                # Every object uses the same collision material, so only convert it to a dictionary once.
+                obi_collision_material_dict = obi_collision_material.to_dict()
+                commands.append({"$type": "set_floor_obi_collision_material", **obi_collision_material_dict})
                 for object_id in object_ids:
-                    commands.append({"$type": "create_obi_colliders",
-                                     "id": object_id})
-                    object_material_command = {"$type": "set_obi_collision_material",
-                                               "id": object_id}
-                    object_material_command.update(obi_collision_material.to_dict())
-                    commands.append(object_material_command)
+                    commands.extend([{"$type": "create_obi_colliders",
+                                      "id": object_id},
+                                     {"$type": "set_obi_collision_material",
+                                      "id": object_id,
+                                      **obi_collision_material_dict}])
                 if obi_particle_data:
                     commands.append({"$type": "send_obi_particles",
                                      "frequency": "always"})
@@ -155,8 +150,10 @@ class PerformanceBenchmarkController(Controller):
 
         def __get_position() -> Tuple[float, float]:
             px, pz = free_cells[free_cell_indices.pop(0)]
-            return (rng.uniform(px - cell_size * 0.33, px + cell_size * 0.33),
-                    rng.uniform(pz - cell_size * 0.33, pz + cell_size * 0.33))
+            # Draw both coordinates at once. This yields the same values as two sequential `rng.uniform()` calls.
+            qx, qz = rng.uniform([px - cell_size * 0.33, pz - cell_size * 0.33],
+                                 [px + cell_size * 0.33, pz + cell_size * 0.33]).tolist()
+            return qx, qz
 
         if random_seed is None:
             rng: np.random.RandomState = np.random.RandomState()
@@ -172,15 +169,10 @@ class PerformanceBenchmarkController(Controller):
                                   [-1, 0, 0, 0, 0, 0, 0, 0, -1],
                                   [-1, 0, 0, 0, 0, 0, 0, 0, -1],
                                   [-1, -1, -1, -1, -1, -1, -1, -1, -1]])
-        free_cells = []
-        for ix, iz in np.ndindex(occupancy_map.shape):
-            if occupancy_map[ix][iz] == 0:
-                x = -2.0 + (ix * cell_size)
-                z = -2.0 + (iz * cell_size)
-                free_cells.append((x, z))
-        free_cell_indices = list(range(len(free_cells)))
-        rng.shuffle(free_cell_indices)
-        free_cell_indices = list(free_cell_indices)
+        # Convert the indices of the free cells to worldspace positions.
+        free_cells = [(x, z) for x, z in (-2.0 + (np.argwhere(occupancy_map == 0) * cell_size)).tolist()]
+        # This is the same random order as shuffling `list(range(len(free_cells)))`.
+        free_cell_indices = rng.permutation(len(free_cells)).tolist()
 
         commands = [{'$type': "load_scene",
                      'scene_name': "ProcGenScene"},
@@ -223,9 +215,10 @@ class PerformanceBenchmarkController(Controller):
         # Start the benchmark.
         self.communicate(commands)
         self.benchmark.start()
-        for trial_frame in range(1000):
+        # Draw every frame's random action at once. This yields the same values as one draw per frame.
+        random_actions = np.random.uniform(-200, 200, (1000, 2)).tolist()
+        for random_action in random_actions:
             commands.clear()
-            random_action = np.random.uniform(-200, 200, 2)
             # Actual TDW actions.
             for p_idx in range(5):
                 commands.extend([{"$type": "move_avatar_forward_by",
@@ -11,7 +11,7 @@ from tdw.release.build import Build
 from tdw.release.pypi import PyPi
 from tdw.version import __version__
 from tdw.add_ons.add_on import AddOn
-from tdw.physics_audio.object_audio_static import DEFAULT_OBJECT_AUDIO_STATIC_DATA
+from tdw.physics_audio import object_audio_static
 from tdw.physics_audio.audio_material import AudioMaterial
 from tdw.physics_audio.audio_material_constants import STATIC_FRICTION, DYNAMIC_FRICTION, DENSITIES
 
@@ -109,8 +109,8 @@ class Controller:
         for m in self.add_ons:
             m.before_send(commands)
 
-        # Serialize the message.
-        msg = [json.dumps(commands).encode('utf-8')]
+        # Serialize the message. Omit the whitespace after separators to reduce the size of the message.
+        msg = [json.dumps(commands, separators=(",", ":")).encode('utf-8')]
         # Send the commands.
         self.socket.send_multipart(msg)
         # Receive output data.
@@ -213,8 +213,6 @@ class Controller:
         if position is None:
             position = {"x": 0, "y": 0, "z": 0}
         record = Controller.MODEL_LIBRARIANS[library].get_record(model_name)
-        if position is None:
-            position = {"x": 0, "y": 0, "z": 0}
         commands = [{"$type": "add_object",
                      "name": record.name,
                      "url": record.get_url(),
@@ -244,11 +242,14 @@ class Controller:
                              "mode": "continuous_speculative"})
 
         if default_physics_values:
+            # Accessing this the first time loads the default audio data.
+            default_audio_data = object_audio_static.DEFAULT_OBJECT_AUDIO_STATIC_DATA
             # Use default physics values.
-            if model_name in DEFAULT_OBJECT_AUDIO_STATIC_DATA:
-                mass = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].mass
-                bounciness = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].bounciness
-                material = DEFAULT_OBJECT_AUDIO_STATIC_DATA[model_name].material
+            if model_name in default_audio_data:
+                audio_static = default_audio_data[model_name]
+                mass = audio_static.mass
+                bounciness = audio_static.bounciness
+                material = audio_static.material
             # Fallback: Try to derive physics values from existing data.
             else:
                 if "models_full.json" not in Controller.MODEL_LIBRARIANS:
@@ -256,11 +257,11 @@ class Controller:
                 # Get all models in the same category that have default physics values.
                 records = Controller.MODEL_LIBRARIANS["models_full.json"].get_all_models_in_wnid(record.wnid)
                 records = [r for r in records if not r.do_not_use and r.name != record.name and r.name in
-                           DEFAULT_OBJECT_AUDIO_STATIC_DATA]
+                           default_audio_data]
                 # Fallback: Find objects with similar volume.
                 if len(records) == 0:
                     records = [r for r in Controller.MODEL_LIBRARIANS["models_full.json"].records if r.name in
-                               DEFAULT_OBJECT_AUDIO_STATIC_DATA and not r.do_not_use and r.name != record.name and
+                               default_audio_data and not r.do_not_use and r.name != record.name and
                                0.8 <= abs(r.volume / record.volume) <= 1.2]
                 # Fallback: Select a default material and bounciness.
                 if len(records) == 0:
@@ -269,9 +270,9 @@ class Controller:
                     bounciness: float = 0
                 # Select the most common material and bounciness.
                 else:
-                    materials: List[AudioMaterial] = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].material for r in records]
+                    materials: List[AudioMaterial] = [default_audio_data[r.name].material for r in records]
                     material: AudioMaterial = max(set(materials), key=materials.count)
-                    bouncinesses = [DEFAULT_OBJECT_AUDIO_STATIC_DATA[r.name].bounciness for r in records]
+                    bouncinesses = [default_audio_data[r.name].bounciness for r in records]
                     bounciness = round(sum(bouncinesses) / len(bouncinesses), 3)
                 # Derive the mass.
                 mass = DENSITIES[material] * record.volume
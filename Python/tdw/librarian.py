@@ -283,6 +283,11 @@ class _Librarian(Generic[T]):
                 temp_urls[p] = temp_urls[p].replace("\\", "/")
             record.urls = temp_urls
             self.records.append(record)
+        # The index of each record in `self.records`, keyed by name. See: `get_record()`.
+        self._record_indices: Dict[str, int] = dict()
+        # The list and the length of the list that `self._record_indices` was built from.
+        self._indexed_records: List[T] = list()
+        self._num_indexed_records: int = -1
 
     def get_default_library(self) -> str:
         """
@@ -321,12 +326,32 @@ class _Librarian(Generic[T]):
         :param name: The name of the record.
         """
 
-        records = [r for r in self.records if r.name == name]
-
-        if len(records) == 0:
+        # Rebuild the index if `self.records` has been replaced, or if records have been added or removed.
+        if self._indexed_records is not self.records or self._num_indexed_records != len(self.records):
+            self._index_records()
+        # Don't search the whole list on a miss. A record renamed in-place is found by its new name once the index is rebuilt.
+        if name not in self._record_indices:
             return None
-        else:
-            return records[0]
+        record = self.records[self._record_indices[name]]
+        if record.name == name:
+            return record
+        # A record has been renamed or replaced in-place. Rebuild the index and try again.
+        self._index_records()
+        if name in self._record_indices:
+            return self.records[self._record_indices[name]]
+        return None
+
+    def _index_records(self) -> None:
+        """
+        Index each record in `self.records` by name. If there are duplicate names, the first record is indexed.
+        """
+
+        self._record_indices.clear()
+        for i, r in enumerate(self.records):
+            if r.name not in self._record_indices:
+                self._record_indices[r.name] = i
+        self._indexed_records = self.records
+        self._num_indexed_records = len(self.records)
 
     def search_records(self, search: str) -> List[T]:
         """
@@ -356,11 +381,12 @@ class _Librarian(Generic[T]):
                 print(f"\t{p}")
 
         added = False
-        if len([r for r in self.records if r.name == record.name]) > 0:
+        if self.get_record(record.name) is not None:
             # If this record exists and we want to overwrite, update the record.
             if overwrite:
                 records_list = [r for r in self.records if r.name != record.name]
                 records_list.append(record)
+                self.records = records_list
                 added = True
         # Add the record.
         else:
@@ -48,7 +48,7 @@ class CollisionMaterial:
         :return: A JSON dictionary of this object.
         """
 
-        d = {k: v for k, v in self.__dict__.items()}
+        d = self.__dict__.copy()
         d["friction_combine"] = d["friction_combine"].name
         d["stickiness_combine"] = d["stickiness_combine"].name
         return d
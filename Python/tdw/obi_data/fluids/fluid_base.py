@@ -51,7 +51,7 @@ class FluidBase(ABC):
         """
 
         d = {"$type": self._get_type()}
-        d.update({k: v for k, v in self.__dict__.items()})
+        d.update(self.__dict__)
         return d
 
     @abstractmethod
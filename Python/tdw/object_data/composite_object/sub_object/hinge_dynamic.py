@@ -16,14 +16,16 @@ class HingeDynamic(SubObjectDynamic):
 
         super().__init__(dynamic_composite_objects=dynamic_composite_objects, object_index=object_index,
                          sub_object_index=sub_object_index)
+        # Read the hinge's table once rather than once per field.
+        _, angle, velocity = dynamic_composite_objects.get_hinge(object_index, sub_object_index)
         """:field
         The angle in degrees of the hinge relative to its resting position.
         """
-        self.angle: float = dynamic_composite_objects.get_hinge_angle(object_index, sub_object_index)
+        self.angle: float = angle
         """:field
         The angular velocity in degrees per second of the hinge.
         """
-        self.velocity: float = dynamic_composite_objects.get_hinge_velocity(object_index, sub_object_index)
+        self.velocity: float = velocity
 
     def _get_sub_object_id(self, dynamic_composite_objects: DynamicCompositeObjects, object_index: int,
                            sub_object_index: int) -> int:
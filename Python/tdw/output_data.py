@@ -65,6 +65,10 @@ class OutputDataUndefinedError(Exception):
 
 
 class OutputData(object):
+    # Collision states. Any other value is "exit".
+    _COLLISION_STATES = {1: "enter",
+                         2: "stay"}
+
     def __init__(self, b):
         self.bytes = bytearray(b)
         self.data = self.get_data()
@@ -499,13 +503,7 @@ class Collision(OutputData):
         return OutputData._get_xyz(self.data.RelativeVelocity())
 
     def get_state(self) -> str:
-        state = self.data.State()
-        if state == 1:
-            return "enter"
-        elif state == 2:
-            return "stay"
-        else:
-            return "exit"
+        return OutputData._COLLISION_STATES.get(self.data.State(), "exit")
 
     def get_num_contacts(self) -> int:
         return self.data.ContactsLength()
@@ -670,6 +668,8 @@ class VRRig(OutputData):
 
 class OculusTouchButtons(OutputData):
     BUTTONS = [b for b in OculusTouchButton]
+    # The bit mask of each button.
+    _BUTTON_MASKS = [(1 << i, b) for (i, b) in enumerate(BUTTONS)]
 
     def get_data(self) -> OculusTouch.OculusTouchButtons:
         return OculusTouch.OculusTouchButtons.GetRootAsOculusTouchButtons(self.bytes, 0)
@@ -682,7 +682,10 @@ class OculusTouchButtons(OutputData):
 
     @staticmethod
     def _get_buttons(v: int) -> List[OculusTouchButton]:
-        return [OculusTouchButtons.BUTTONS[i] for (i, b) in enumerate(OculusTouchButtons.BUTTONS) if v & (1 << i) != 0]
+        # No buttons are pressed on most frames.
+        if v == 0:
+            return []
+        return [b for (m, b) in OculusTouchButtons._BUTTON_MASKS if v & m != 0]
 
 
 class StaticOculusTouch(OutputData):
@@ -805,13 +808,7 @@ class EnvironmentCollision(OutputData):
         return self.data.ObjectId()
 
     def get_state(self) -> str:
-        state = self.data.State()
-        if state == 1:
-            return "enter"
-        elif state == 2:
-            return "stay"
-        else:
-            return "exit"
+        return OutputData._COLLISION_STATES.get(self.data.State(), "exit")
 
     def get_num_contacts(self) -> int:
         return self.data.ContactsLength()
@@ -1131,13 +1128,7 @@ class TriggerCollision(OutputData):
         return self.data.TriggerId()
 
     def get_state(self) -> str:
-        state = self.data.State()
-        if state == 1:
-            return "enter"
-        elif state == 2:
-            return "stay"
-        else:
-            return "exit"
+        return OutputData._COLLISION_STATES.get(self.data.State(), "exit")
 
 
 class LocalTransforms(OutputData):
@@ -1412,6 +1403,10 @@ class DynamicCompositeObjects(OutputData):
     def get_hinge_velocity(self, index: int, hinge_index: int) -> float:
         return self.data.Objects(index).Hinges(hinge_index).Velocity()
 
+    def get_hinge(self, index: int, hinge_index: int) -> Tuple[int, float, float]:
+        hinge = self.data.Objects(index).Hinges(hinge_index)
+        return hinge.Id(), hinge.Angle(), hinge.Velocity()
+
     def get_num_lights(self, index: int) -> int:
         return self.data.Objects(index).LightsLength()
 
@@ -139,7 +139,8 @@ class CollisionAudioEvent:
         # Source: https://stackoverflow.com/a/68115011
         points = np.array(self.collision.points)
         edges = points[1:] - points[0:1]
-        return sum(np.linalg.norm(np.cross(edges[:-1], edges[1:], axis=1), axis=1) / 2)
+        # Sum the triangle areas in NumPy rather than iterating over the array in Python.
+        return float(np.linalg.norm(np.cross(edges[:-1], edges[1:], axis=1), axis=1).sum()) / 2
 
     def _set_as_impact(self, obj_obj: bool, object_0_static: ObjectAudioStatic, object_1_static: ObjectAudioStatic) -> None:
         """
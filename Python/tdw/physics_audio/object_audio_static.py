@@ -1,8 +1,9 @@
 import io
+from sys import version_info
 from csv import DictReader
 from pathlib import Path
 from pkg_resources import resource_filename
-from typing import Union, Dict
+from typing import Union, Dict, Optional
 from tdw.physics_audio.audio_material import AudioMaterial
 
 
@@ -90,4 +91,19 @@ def get_static_audio_data(csv_file: Union[str, Path] = "") -> Dict[str, ObjectAu
     return objects
 
 
-DEFAULT_OBJECT_AUDIO_STATIC_DATA: Dict[str, ObjectAudioStatic] = get_static_audio_data()
+# The default audio data. On Python 3.7+, this is parsed the first time `DEFAULT_OBJECT_AUDIO_STATIC_DATA` is accessed.
+_DEFAULT_OBJECT_AUDIO_STATIC_DATA: Optional[Dict[str, ObjectAudioStatic]] = None
+
+
+if version_info >= (3, 7):
+    def __getattr__(name: str):
+        # Load `DEFAULT_OBJECT_AUDIO_STATIC_DATA` lazily so that importing this module doesn't parse objects.csv.
+        global _DEFAULT_OBJECT_AUDIO_STATIC_DATA
+        if name == "DEFAULT_OBJECT_AUDIO_STATIC_DATA":
+            if _DEFAULT_OBJECT_AUDIO_STATIC_DATA is None:
+                _DEFAULT_OBJECT_AUDIO_STATIC_DATA = get_static_audio_data()
+            return _DEFAULT_OBJECT_AUDIO_STATIC_DATA
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+else:
+    # Python 3.6 doesn't support module-level `__getattr__` (PEP 562), so parse objects.csv now.
+    DEFAULT_OBJECT_AUDIO_STATIC_DATA: Dict[str, ObjectAudioStatic] = get_static_audio_data()
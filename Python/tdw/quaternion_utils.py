@@ -210,10 +210,7 @@ class QuaternionUtils:
         :return: True if `target` is to the left of `origin` by the `forward` vector; False if it's to the right.
         """
 
-        # Get the heading.
-        target_direction = target - origin
-        # Normalize the heading.
-        target_direction = target_direction / np.linalg.norm(target_direction)
-        perpendicular: np.array = np.cross(forward, target_direction)
-        direction = np.dot(perpendicular, QuaternionUtils.UP)
+        # This is the y component of `forward x (target - origin)`, i.e. the dot product of the perpendicular and `UP`.
+        # The heading doesn't need to be normalized because only the sign matters.
+        direction = forward[2] * (target[0] - origin[0]) - forward[0] * (target[2] - origin[2])
         return direction > 0
@@ -72,7 +72,7 @@ class RobotDynamic:
                             previous: RobotDynamic
                             previous_joint: JointDynamic = previous.joints[joint.joint_id]
                             for k in range(len(previous_joint.angles)):
-                                if np.linalg.norm(previous_joint.angles[k] - joint.angles[k]) > RobotDynamic.NON_MOVING:
+                                if abs(previous_joint.angles[k] - joint.angles[k]) > RobotDynamic.NON_MOVING:
                                     joint.moving = True
                                     break
                         self.joints[joint.joint_id] = joint
@@ -53,5 +53,5 @@ class RobotStatic:
                     for j in range(static_robot.get_num_non_moving()):
                         non_moving = NonMoving(static_robot=static_robot, index=j)
                         self.non_moving[non_moving.object_id] = non_moving
-        self.body_parts: List[int] = list(self.joints.keys())
-        self.body_parts.extend(self.non_moving.keys())
+                    break
+        self.body_parts = [*self.joints, *self.non_moving]
@@ -1,3 +1,4 @@
+import numpy as np
 from tdw.output_data import SceneRegions
 
 
@@ -58,3 +59,13 @@ class RegionBounds:
         """
 
         return self.x_min <= x <= self.x_max and self.z_min <= z <= self.z_max
+
+    def is_inside_batch(self, xs: np.ndarray, zs: np.ndarray) -> np.ndarray:
+        """
+        :param xs: A numpy array of x coordinates.
+        :param zs: A numpy array of z coordinates. Must be the same shape as `xs`.
+
+        :return: A numpy array of booleans, the same shape as `xs`. Each element is True if position (x, z) is in the scene.
+        """
+
+        return (xs >= self.x_min) & (xs <= self.x_max) & (zs >= self.z_min) & (zs <= self.z_max)
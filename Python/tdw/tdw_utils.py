@@ -4,7 +4,6 @@ import math
 from platform import system
 from requests import get
 from tqdm import tqdm
-from scipy.spatial import distance
 from tdw.output_data import IsOnNavMesh, Images, Bounds
 from PIL import Image
 import io
@@ -35,6 +34,7 @@ class TDWUtils:
     # Cached values used during point cloud generation.
     __WIDTH: int = -1
     __HEIGHT: int = -1
+    __VFOV: float = -1
     __CAM_TO_IMG_MAT: Optional[np.array] = None
 
     @staticmethod
@@ -137,7 +137,7 @@ class TDWUtils:
         :return The vector magnitude.
         """
 
-        return np.linalg.norm(TDWUtils.vector3_to_array(vector3))
+        return math.sqrt(vector3["x"] * vector3["x"] + vector3["y"] * vector3["y"] + vector3["z"] * vector3["z"])
 
     @staticmethod
     def extend_line(p0: np.array, p1: np.array, d: float, clamp_y=True) -> np.array:
@@ -157,7 +157,7 @@ class TDWUtils:
             p1[1] = 0
 
         # Get the distance between the two points.
-        d0 = distance.euclidean(p0, p1)
+        d0 = np.linalg.norm(p0 - p1)
         # Get the total distance.
         d_total = d0 + d
 
@@ -174,7 +174,10 @@ class TDWUtils:
         :return The distance.
         """
 
-        return distance.euclidean(TDWUtils.vector3_to_array(vector3_0), TDWUtils.vector3_to_array(vector3_1))
+        dx = vector3_0["x"] - vector3_1["x"]
+        dy = vector3_0["y"] - vector3_1["y"]
+        dz = vector3_0["z"] - vector3_1["z"]
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     @staticmethod
     def get_box(width: int, length: int) -> List[Dict[str, int]]:
@@ -462,9 +465,11 @@ class TDWUtils:
         camera_matrix = np.dot(camera_matrix, rot)
 
         # Cache some calculations we'll need to use every time.
-        if TDWUtils.__HEIGHT != depth.shape[0] or TDWUtils.__WIDTH != depth.shape[1]:
+        # The cached matrix depends on the image size and the field of view.
+        if TDWUtils.__HEIGHT != depth.shape[0] or TDWUtils.__WIDTH != depth.shape[1] or TDWUtils.__VFOV != vfov:
             TDWUtils.__HEIGHT = depth.shape[0]
             TDWUtils.__WIDTH = depth.shape[1]
+            TDWUtils.__VFOV = vfov
 
             img_pixs = np.mgrid[0: depth.shape[0], 0: depth.shape[1]].reshape(2, -1)
             # Swap (v, u) into (u, v).
@@ -635,13 +640,21 @@ class TDWUtils:
         """
 
         if isinstance(bounds, Bounds):
-            return np.array([np.linalg.norm(np.array(bounds.get_left(index)) - np.array(bounds.get_right(index))),
-                             np.linalg.norm(np.array(bounds.get_top(index)) - np.array(bounds.get_bottom(index))),
-                             np.linalg.norm(np.array(bounds.get_front(index)) - np.array(bounds.get_back(index)))])
+            # Get the (left - right), (top - bottom), and (front - back) vectors in a single array.
+            d = np.array([bounds.get_left(index), bounds.get_top(index), bounds.get_front(index)]) - \
+                np.array([bounds.get_right(index), bounds.get_bottom(index), bounds.get_back(index)])
+            return np.sqrt(np.einsum("ij,ij->i", d, d))
         elif isinstance(bounds, dict):
-            return np.array([np.linalg.norm(TDWUtils.vector3_to_array(bounds["left"]) - TDWUtils.vector3_to_array(bounds["right"])),
-                             np.linalg.norm(TDWUtils.vector3_to_array(bounds["top"]) - TDWUtils.vector3_to_array(bounds["bottom"])),
-                             np.linalg.norm(TDWUtils.vector3_to_array(bounds["front"]) - TDWUtils.vector3_to_array(bounds["back"]))])
+            # Calculate the distances directly from the Vector3 dictionaries rather than converting them to arrays.
+            extents: List[float] = list()
+            for side_0, side_1 in (("left", "right"), ("top", "bottom"), ("front", "back")):
+                p0 = bounds[side_0]
+                p1 = bounds[side_1]
+                dx = p0["x"] - p1["x"]
+                dy = p0["y"] - p1["y"]
+                dz = p0["z"] - p1["z"]
+                extents.append(math.sqrt(dx * dx + dy * dy + dz * dz))
+            return np.array(extents)
         else:
             raise Exception(f"Invalid bounds data: {bounds}")
 
@@ -655,17 +668,16 @@ class TDWUtils:
         :return: The position on the object bounds that is closest to `origin`.
         """
 
-        object_bounds = TDWUtils.get_bounds_dict(bounds=bounds, index=index)
-
-        # Get the closest point on the bounds.
-        min_destination = ""
-        min_distance = 10000
-        for p in object_bounds:
-            d = np.linalg.norm(origin - object_bounds[p])
-            if d < min_distance:
-                min_distance = d
-                min_destination = p
-        return object_bounds[min_destination]
+        positions = np.array([bounds.get_top(index),
+                              bounds.get_bottom(index),
+                              bounds.get_left(index),
+                              bounds.get_right(index),
+                              bounds.get_front(index),
+                              bounds.get_back(index),
+                              bounds.get_center(index)])
+        # Get the closest point on the bounds. The squared distance is sufficient for comparison.
+        diff = positions - origin
+        return positions[int(np.argmin(np.einsum("ij,ij->i", diff, diff)))]
 
     @staticmethod
     def get_angle(forward: np.array, origin: np.array, position: np.array) -> float:
@@ -677,15 +689,13 @@ class TDWUtils:
           :return: The angle in degrees between `forward` and the direction vector from `origin` to `position`.
           """
 
-        # Get the normalized directional vector to the target position.
-        p0 = np.array([origin[0], origin[2]])
-        p1 = np.array([position[0], position[2]])
-        d = p1 - p0
-        d = d / np.linalg.norm(d)
-        f = np.array([forward[0], forward[2]])
+        # Get the directional vector to the target position.
+        # arctan2() only depends on the ratio of `det` and `dot`, so the vector doesn't need to be normalized.
+        dx = position[0] - origin[0]
+        dz = position[2] - origin[2]
 
-        dot = f[0] * d[0] + f[1] * d[1]
-        det = f[0] * d[1] - f[1] * d[0]
+        dot = forward[0] * dx + forward[2] * dz
+        det = forward[0] * dz - forward[2] * dx
         angle = np.arctan2(det, dot)
         angle = np.rad2deg(angle)
         return angle
@@ -716,12 +726,12 @@ class TDWUtils:
         :return: The rotated position.
         """
 
-        if origin is None:
-            origin = np.array([0, 0, 0])
-
         radians = np.deg2rad(angle)
         x, y = position[0], position[2]
-        offset_x, offset_y = origin[0], origin[2]
+        if origin is None:
+            offset_x, offset_y = 0, 0
+        else:
+            offset_x, offset_y = origin[0], origin[2]
         adjusted_x = (x - offset_x)
         adjusted_y = (y - offset_y)
         cos_rad = np.cos(radians)
@@ -835,13 +845,14 @@ class TDWUtils:
                 remote_librarian = librarian_type(remote_librarian_key)
                 # Download each asset bundle.
                 for asset_bundle_name in asset_bundles[remote_librarian_key]:
-                    remote_record = remote_librarian.get_record(asset_bundle_name)
                     asset_bundle_path = asset_bundles_directory.joinpath(asset_bundle_name)
                     # This asset bundle already exists.
                     if asset_bundle_path.exists():
                         pbar.update(1)
                         continue
                     pbar.set_description(asset_bundle_name)
+                    # Only look up the record of an asset bundle that needs to be downloaded.
+                    remote_record = remote_librarian.get_record(asset_bundle_name)
                     url = remote_record.urls[system()]
                     if private_bucket_prefix in url:
                         # Make sure we can download from tdw-private.